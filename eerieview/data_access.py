@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import intake
@@ -11,8 +12,13 @@ from eerieview.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_main_catalogue():
-    """Open the main EERIE Intake catalogue."""
+    """Open the main EERIE Intake catalogue.
+
+    The catalogue is opened only once per process and the same object is returned in
+    the next calls, as parsing the remote YAML files is slow.
+    """
     catalogue = intake.open_catalog(
         "https://raw.githubusercontent.com/eerie-project/intake_catalogues/main/eerie.yaml"
     )
@@ -69,9 +75,9 @@ def get_entry_dataset(
     logger.info(f"Read EERIE member {member} to an xarray Dataset.")
     location_prefix = location2prefix[location]
     member_str = location_prefix + "." + member.to_string()
-    catalogue_entry = catalogue[member_str](
-        driver="kerchunk", chunks=dict(time=100, lon=100, lat=100)
-    )  # type: ignore
+    # chunks={} uses the chunks of the files on disk, so each dask chunk reads whole
+    # compressed chunks. Consumers rechunk only where their computation needs it.
+    catalogue_entry = catalogue[member_str](driver="kerchunk", chunks={})  # type: ignore
     dataset = to_dask_funct(catalogue_entry)
 
     if (
@@ -80,21 +86,25 @@ def get_entry_dataset(
         and isinstance(member, EERIEMember)
     ):
         member_spin_up = member_str.replace("control", "spinup")
-        print(f"Reading spinup from {member_spin_up}")
-        dataset_spin_up = to_dask_funct(catalogue[member_spin_up])
+        logger.info(f"Reading spinup from {member_spin_up}")
+        dataset_spin_up = to_dask_funct(catalogue[member_spin_up](chunks={}))
         dataset = xarray.concat([dataset_spin_up, dataset], dim="time")
         dataset = dataset.sortby("time").drop_duplicates(dim="time")
 
     dataset = dataset[[rawname]].astype("float32")
     if "lon" not in dataset.dims and "native" not in member_str:
         dataset = dataset.set_index(value=("lat", "lon")).unstack("value")
-    logger.info(dataset)
+    logger.debug(
+        f"Dataset sizes {dict(dataset.sizes)}, variables {list(dataset.data_vars)}"
+    )
     if "time_2" in dataset.coords:
         logger.warning("Renaming time_2 to time")
         if "time" in dataset.dims:
             logger.info("Removing time")
             dataset = dataset.drop_dims("time")
-        logger.info(dataset)
+        logger.debug(
+            f"Dataset sizes {dict(dataset.sizes)}, variables {list(dataset.data_vars)}"
+        )
         dataset = dataset.rename(time_2="time")
     time_index = dataset.time.to_index()
     logger.info(
@@ -1,5 +1,4 @@
-import copy
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, fields, replace
 from pathlib import Path
 from typing import ClassVar, Literal, Tuple
 
@@ -11,7 +10,7 @@ EERIEProduct = Literal["series"] | DecadalProduct
 Period = Tuple[int, int]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Member:
     model: str
     simulation: str
@@ -44,7 +43,7 @@ class Member:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EERIEMember(Member):
     # 'ifs-fesom2-sr.hist-1950.v20240304.atmos.gr025.2D_monthly_avg'
     realm: str
@@ -53,22 +52,16 @@ class EERIEMember(Member):
     npieces: ClassVar[int] = 6
 
     def to_ocean(self) -> "EERIEMember":
-        new = copy.copy(self)
-        new.realm = "ocean"
-        return new
+        return replace(self, realm="ocean")
 
     def to_atmos(self) -> "EERIEMember":
-        new = copy.copy(self)
-        new.realm = "atmos"
-        return new
+        return replace(self, realm="atmos")
 
     def to_daily(self) -> "EERIEMember":
-        new = copy.copy(self)
-        new.freq = "daily"
-        return new
+        return replace(self, freq="daily")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CmorEerieMember(Member):
     # 'ifs-nemo-er.hist-1950.v20250516.gr025.Amon'
     grid: str
@@ -76,23 +69,17 @@ class CmorEerieMember(Member):
     npieces: ClassVar[int] = 5
 
     def to_ocean(self) -> "CmorEerieMember":
-        new = copy.copy(self)
-        new.cmor_table = self.cmor_table.replace("A", "O")
-        return new
+        return replace(self, cmor_table=self.cmor_table.replace("A", "O"))
 
     def to_atmos(self) -> "CmorEerieMember":
-        new = copy.copy(self)
-        new.cmor_table = self.cmor_table.replace("O", "A")
-        return new
+        return replace(self, cmor_table=self.cmor_table.replace("O", "A"))
 
     def to_daily(self) -> "CmorEerieMember":
         if self.cmor_table == "Omon":
             new_table = "Oday"
         else:
             new_table = "day"
-        new = copy.copy(self)
-        new.cmor_table = new_table
-        return new
+        return replace(self, cmor_table=new_table)
 
 
 @dataclass
@@ -3,7 +3,7 @@ from dataclasses import replace
 from datetime import datetime
 from itertools import chain
 from pathlib import Path
-from typing import Callable, Union
+from typing import Callable, Sequence, Union
 
 import numpy
 import xarray
@@ -94,6 +94,47 @@ def fix_360_longitudes(dataset: xarray.Dataset) -> xarray.Dataset:
     return dataset
 
 
+def get_auto_chunks(
+    dataset: xarray.Dataset, target_bytes: int = 128 * 2**20, max_time_chunk: int = 365
+) -> dict[str, int]:
+    """Compute dask chunk sizes for a dataset from a target size in bytes per chunk.
+
+    The time chunk is one year (or the whole time axis if it is shorter) and the
+    other dimensions of the largest variable share the rest of the budget with equal
+    chunk sizes, so the tiles grow with the resolution instead of being fixed.
+
+    Parameters
+    ----------
+    dataset : xarray.Dataset
+        The input dataset, it must have a time dimension.
+    target_bytes : int, optional
+        The approximate size of each chunk in bytes. Defaults to 128 MiB.
+    max_time_chunk : int, optional
+        The maximum length of the chunks along time. Defaults to 365.
+
+    Returns
+    -------
+    dict[str, int]
+        The chunk size of each dimension of the largest variable.
+    """
+    variable = max(dataset.data_vars.values(), key=lambda v: v.size)
+    time_chunk = min(max_time_chunk, dataset.sizes["time"])
+    other_dims = [dim for dim in variable.dims if dim != "time"]
+    other_chunk = (target_bytes / variable.dtype.itemsize / time_chunk) ** (
+        1 / max(len(other_dims), 1)
+    )
+    chunks = dict(time=time_chunk)
+    for dim in other_dims:
+        chunks[dim] = min(max(int(other_chunk), 1), dataset.sizes[dim])
+    nchunks = numpy.prod([-(-dataset.sizes[d] // c) for d, c in chunks.items()])
+    if nchunks > 1_000_000:
+        logger.warning(
+            f"Chunks {chunks} give {nchunks} chunks per variable, the dask graph "
+            "will be very large, consider increasing target_bytes."
+        )
+    return chunks
+
+
 def get_time_filters() -> tuple[TimeFilter, ...]:
     """Retrieve a predefined set of time filters including 'year' and standard seasons.
 
@@ -176,15 +217,48 @@ def filter_time_axis(
     RuntimeError
         If the `time_filter.units` are not supported.
     """
-    if time_filter.units == "season":
-        dataset = seltime(dataset, "time", season=time_filter.freq)  # type: ignore
-    elif time_filter.units == "month":
-        dataset = seltime(dataset, "time", month=time_filter.freq)  # type: ignore
-    elif time_filter.units == "year":
-        pass  # No filtering is needed
-    else:
-        raise RuntimeError(f"{time_filter.units} are not supported")
-    return dataset
+    return filter_time_axes(dataset, [time_filter])[0]
+
+
+def filter_time_axes(
+    dataset: xarray.Dataset, time_filters: Sequence[TimeFilter]
+) -> list[xarray.Dataset]:
+    """Filter the time axis of a dataset with each TimeFilter of a sequence.
+
+    The months and seasons of the time axis are decoded only once, however many
+    time filters use them.
+
+    Parameters
+    ----------
+    dataset : xarray.Dataset
+        The input dataset.
+    time_filters : Sequence[TimeFilter]
+        The time filter configurations to apply.
+
+    Returns
+    -------
+    list[xarray.Dataset]
+        The filtered datasets, in the same order as `time_filters`.
+
+    Raises
+    ------
+    RuntimeError
+        If the units of any of the `time_filters` are not supported.
+    """
+    time_values: dict[str, numpy.ndarray] = {}
+    filtered = []
+    for time_filter in time_filters:
+        units = time_filter.units
+        if units == "year":
+            filtered.append(dataset)
+            continue
+        if units not in ("season", "month"):
+            raise RuntimeError(f"{units} are not supported")
+        if units not in time_values:
+            time_values[units] = dataset[f"time.{units}"].values
+        time_mask = numpy.isin(time_values[units], time_filter.freq)
+        filtered.append(dataset.isel(time=time_mask))
+    return filtered
 
 
 def define_extra_dimensions(
@@ -420,13 +494,15 @@ def retry_get_entry_with_fixes(
         path_with_files = Path(basedir, dirs)
         paths_to_read = sorted(path_with_files.glob(pattern_to_expand))
         logger.info(f"{path_with_files}/{pattern_to_expand}")
+        with xarray.open_dataset(paths_to_read[0]) as first_dataset:
+            chunks = get_auto_chunks(first_dataset)
         dataset = xarray.open_mfdataset(
             paths_to_read,
             concat_dim="time",
             combine="nested",
             coords="minimal",
             data_vars="minimal",
-            chunks=dict(time=1000, lat=100, lon=100),
+            chunks=chunks,
         )
     else:
         raise RuntimeError(f"Unknown member type {member}")
@@ -24,11 +24,11 @@ def rolling_smooth_annual_cycly(da: xarray.DataArray) -> xarray.DataArray:
     Step 1: 21-year rolling mean per day-of-year (center=True, min_periods=11).
     Step 2: 5-day temporal smoothing (center=True, min_periods=3).
 
-    Uses sliding_window_view for a fully-vectorized step 1 — no Python loop
-    over years, one nanmean call per Day Of Year (365 DOYs).
+    Step 1 uses running sums over the years of each Day Of Year (365 DOYs), so
+    the sum and the count of valid values of every window are the difference of
+    two running sums, instead of reducing the 21 values of each window.
     """
     import pandas
-    from numpy.lib.stride_tricks import sliding_window_view
 
     if da.isnull().all():
         return da
@@ -45,19 +45,25 @@ def rolling_smooth_annual_cycly(da: xarray.DataArray) -> xarray.DataArray:
     half = 10  # window = 2*half+1 = 21
     min_periods = 11  # matches original decadal_window_size // 2 + 1
 
-    nan_pad = numpy.full((half, *spatial_shape), numpy.nan)
     for doy in range(1, 366):
         idx = numpy.where(doys == doy)[0]
-        if len(idx) == 0:
+        n_years = len(idx)
+        if n_years == 0:
             continue
         sub = arr[idx]  # (n_years, ...)
-        # NaN-pad both ends so the window is centered (no edge shrinkage)
-        padded = numpy.concatenate([nan_pad, sub, nan_pad], axis=0)
-        # windows: (n_years, ..., 21) — zero-copy view
-        windows = sliding_window_view(padded, window_shape=21, axis=0)
-        count = numpy.sum(~numpy.isnan(windows), axis=-1)
-        with numpy.errstate(invalid="ignore"):
-            mean_val = numpy.nanmean(windows, axis=-1)
+        valid = ~numpy.isnan(sub)
+        # Running sums with a leading zero: the window [lo, hi) sums cumsum[hi] -
+        # cumsum[lo]. Windows are clipped at the ends (centered, no edge shrinkage).
+        cumsum = numpy.zeros((n_years + 1, *spatial_shape))
+        numpy.cumsum(numpy.where(valid, sub, 0), axis=0, out=cumsum[1:])
+        cumcount = numpy.zeros((n_years + 1, *spatial_shape), dtype=int)
+        numpy.cumsum(valid, axis=0, out=cumcount[1:])
+        years = numpy.arange(n_years)
+        lo = numpy.maximum(years - half, 0)
+        hi = numpy.minimum(years + half + 1, n_years)
+        count = cumcount[hi] - cumcount[lo]
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            mean_val = (cumsum[hi] - cumsum[lo]) / count
         mean_val[count < min_periods] = numpy.nan
         clim[idx] = mean_val
 
@@ -69,138 +75,103 @@ def rolling_smooth_annual_cycly(da: xarray.DataArray) -> xarray.DataArray:
     return da.copy(data=smoothed_flat.reshape(original_shape))
 
 
-def _fast_time_coord(da: xarray.DataArray) -> numpy.ndarray:
-    """Return the time coordinate reading only the first two values.
-    Falls back to reading all values if the cadence is not strictly 1 day.
-    """
-    import pandas
+def _clim_and_anom_tile(zos: xarray.DataArray) -> xarray.Dataset:
+    """Compute the rolling climatology and the anomaly of an in-memory spatial tile."""
+    clim = rolling_smooth_annual_cycly(zos)
+    anom = zos - clim
+    return xarray.Dataset(dict(clim=clim, anom=anom)).astype(zos.dtype)
 
-    t0 = da.time[0].values
-    t1 = da.time[1].values
-    if t1 - t0 != numpy.timedelta64(1, "D"):
-        return da.time.values
-    return pandas.date_range(
-        pandas.Timestamp(t0), periods=len(da.time), freq="D"
-    ).values
 
+def compute_clim_and_anom(da: xarray.DataArray, chunk_size: int = 50) -> xarray.Dataset:
+    """Lazily compute the rolling climatology and the daily anomalies.
 
-def _init_zarr_store(
-    da: xarray.DataArray, path: Path, chunk_size: int, varname: str
-) -> None:
-    """Create an empty zarr store using the zarr API directly.
-
-    Avoids xarray's to_zarr(compute=False) + dask.array.empty which writes
-    thousands of empty chunk files (one per zarr chunk), each a metadata op.
-    The zarr API creates only the metadata files (.zgroup, .zarray, .zattrs).
+    The data is rechunked to spatial tiles holding the full time series and the
+    climatology and anomaly of each tile are computed blockwise with map_blocks, so
+    the day of year grouping never crosses chunk boundaries.
     """
-    import shutil
-
-    import zarr
-
-    if path.exists():
-        shutil.rmtree(path)
-    path.mkdir(parents=True)
-
-    chunk_tuple = (500, chunk_size, chunk_size)
-    n_time, n_lat, n_lon = len(da.time), len(da.lat), len(da.lon)
-
-    root = zarr.open_group(str(path), mode="w")
-
-    # Data variable (no data written — missing chunks return fill_value=NaN)
-    root.create_dataset(
-        varname,
-        shape=(n_time, n_lat, n_lon),
-        chunks=chunk_tuple,
-        dtype=da.dtype,
-        fill_value=float("nan"),
-    )
-    root[varname].attrs.update(
-        {
-            "_ARRAY_DIMENSIONS": ["time", "lat", "lon"],
-        }
-    )
-
-    # Coordinate arrays
-    time_vals = _fast_time_coord(da).astype("int64")  # ns since epoch
-    root.create_dataset("time", data=time_vals, dtype="int64")
-    root["time"].attrs.update(
-        {
-            "_ARRAY_DIMENSIONS": ["time"],
-            "units": "nanoseconds since 1970-01-01",
-            "calendar": "proleptic_gregorian",
-        }
-    )
-    root.create_dataset("lat", data=da.lat.values)
-    root["lat"].attrs["_ARRAY_DIMENSIONS"] = ["lat"]
-    root.create_dataset("lon", data=da.lon.values)
-    root["lon"].attrs["_ARRAY_DIMENSIONS"] = ["lon"]
-
-    # Group-level xarray metadata
-    root.attrs["_ARRAY_DIMENSIONS"] = []  # not needed at group level
-    zarr.consolidate_metadata(str(path))
+    tiles = da.chunk({"time": -1, "lat": chunk_size, "lon": chunk_size})
+    template = xarray.Dataset(dict(clim=tiles, anom=tiles))
+    return xarray.map_blocks(_clim_and_anom_tile, tiles, template=template)
 
 
 def write_clim_and_anom(
     da: xarray.DataArray,
-    clim_file: Path,
+    clim_file: Path | None,
     anom_file: Path,
     chunk_size: int = 50,
     num_workers: int | None = None,
 ) -> None:
-    """Write rolling climatology and daily anomalies in a single spatial-block pass.
-
-    Reads each spatial block once, computes the
-    21-year rolling climatology and the anomaly, then writes both to their
-    respective zarr stores. This avoids the alternative of writing clim first
-    and then re-reading it for the subtraction.
+    """Write rolling climatology and daily anomalies in batches of spatial tiles.
+
+    The tiles of chunk_size x chunk_size points are computed and stored in batches of
+    one tile per worker, into the regions of the pre-created stores. The peak memory
+    is then about num_workers times the full time series of a tile (in float64),
+    whatever the size of the grid, so lower num_workers or chunk_size if it does not
+    fit. Both stores are written in the same dask computation, so each tile is
+    computed only once. The climatology is not written if clim_file is None.
     """
-    import gc
-
-    lat_size = len(da.lat)
-    lon_size = len(da.lon)
-    clim_tmp = clim_file.with_suffix(clim_file.suffix + ".tmp")
-    anom_tmp = anom_file.with_suffix(anom_file.suffix + ".tmp")
-
-    logger.info(f"Initialising clim zarr store at {clim_tmp}")
-    _init_zarr_store(da, clim_tmp, chunk_size, varname="zos")
-    logger.info(f"Initialising anom zarr store at {anom_tmp}")
-    _init_zarr_store(da, anom_tmp, chunk_size, varname="zos")
-
-    n_lat = (lat_size + chunk_size - 1) // chunk_size
-    n_lon = (lon_size + chunk_size - 1) // chunk_size
-    n_total = n_lat * n_lon
-    block = 0
-    for lat_start in range(0, lat_size, chunk_size):
-        lat_sl = slice(lat_start, min(lat_start + chunk_size, lat_size))
-        for lon_start in range(0, lon_size, chunk_size):
-            lon_sl = slice(lon_start, min(lon_start + chunk_size, lon_size))
-            block += 1
-            logger.info(f"Clim+anom block {block}/{n_total}")
-
-            raw = (
-                da.isel(lat=lat_sl, lon=lon_sl)
-                .chunk({"time": -1})
-                .compute(scheduler="threads", num_workers=num_workers)
-            )
-            clim = rolling_smooth_annual_cycly(raw)
-            anom = (raw - clim).to_dataset()
-            clim_ds = clim.to_dataset()
-
-            # Drop coords already written during store initialisation
-            region = {"lat": lat_sl, "lon": lon_sl}
-            clim_ds.drop_vars(list(clim_ds.coords)).to_zarr(
-                clim_tmp, region=region, consolidated=False
-            )
-            anom.drop_vars(list(anom.coords)).to_zarr(
-                anom_tmp, region=region, consolidated=False
-            )
-            del raw, clim, clim_ds, anom
-            gc.collect()
+    import os
+
+    import dask.array
+    import zarr
+
+    paths = dict(anom=anom_file.with_suffix(anom_file.suffix + ".tmp"))
+    if clim_file is not None:
+        paths["clim"] = clim_file.with_suffix(clim_file.suffix + ".tmp")
+
+    # Only the metadata and the coordinates are written here. The variables are then
+    # stored batch by batch, both in the same dask computation (two separate to_zarr
+    # writes would get independent graphs and compute each tile twice).
+    clim_and_anom = compute_clim_and_anom(da, chunk_size)
+    encoding = dict(zos=dict(chunks=(500, chunk_size, chunk_size)))
+    for varname, path in paths.items():
+        logger.info(f"Initialising {varname} zarr store at {path}")
+        clim_and_anom[varname].rename("zos").to_dataset().to_zarr(
+            path, mode="w", encoding=encoding, compute=False
+        )
+    targets = [zarr.open_array(str(path / "zos"), mode="r+") for path in paths.values()]
+
+    # The tiles are aligned with the lat/lon chunks of the stores, so they never write
+    # to the same chunk. Consecutive tiles of a batch share the chunks on disk.
+    nlat, nlon = da.sizes["lat"], da.sizes["lon"]
+    tiles = [
+        dict(
+            lat=slice(lat_start, min(lat_start + chunk_size, nlat)),
+            lon=slice(lon_start, min(lon_start + chunk_size, nlon)),
+        )
+        for lat_start in range(0, nlat, chunk_size)
+        for lon_start in range(0, nlon, chunk_size)
+    ]
+    batch_size = num_workers or os.cpu_count() or 1
+    for batch_start in range(0, len(tiles), batch_size):
+        batch = tiles[batch_start : batch_start + batch_size]
+        logger.info(
+            f"Writing {', '.join(paths)} for tiles {batch_start + 1}-"
+            f"{batch_start + len(batch)}/{len(tiles)}"
+        )
+        sources, batch_targets, regions = [], [], []
+        for tile in batch:
+            tile_clim_and_anom = compute_clim_and_anom(da.isel(tile), chunk_size)
+            region = tuple(tile.get(dim, slice(None)) for dim in da.dims)
+            for varname, target in zip(paths, targets):
+                sources.append(tile_clim_and_anom[varname].data)
+                batch_targets.append(target)
+                regions.append(region)
+        dask.array.store(
+            sources,
+            batch_targets,
+            regions=regions,
+            lock=False,
+            scheduler="threads",
+            num_workers=num_workers,
+        )
+    for path in paths.values():
+        zarr.consolidate_metadata(str(path))
 
-    logger.info(f"Renaming {clim_tmp} → {clim_file}")
-    clim_tmp.rename(clim_file)
-    logger.info(f"Renaming {anom_tmp} → {anom_file}")
-    anom_tmp.rename(anom_file)
+    for path in paths.values():
+        final_path = path.with_suffix("")
+        logger.info(f"Renaming {path} → {final_path}")
+        path.rename(final_path)
 
 
 def compute_geostrophic_velocities(
@@ -252,24 +223,35 @@ def compute_geostrophic_velocities(
 
 def compute_monthly_eke(
     dataset: xarray.Dataset,
-    daily_anom_zos_file: Path,
-    zos_daily_climatology_file: Path,
+    daily_anom_zos_file: Path | None = None,
+    zos_daily_climatology_file: Path | None = None,
     num_workers: int | None = None,
 ) -> xarray.Dataset:
     """Compute monthly Eddy Kinetic Energy from the sea level.
 
-    It will persist two files to ease memory pressure.
+    If daily_anom_zos_file is given the daily anomalies are persisted there (and
+    reused if the file already exists) to ease memory pressure, as the geostrophic
+    velocities need them rechunked to whole lat/lon fields. Otherwise they are
+    computed lazily, which needs enough memory to hold them. The rolling climatology
+    is only written if zos_daily_climatology_file is also given.
     """
-    if not daily_anom_zos_file.exists():
-        write_clim_and_anom(
-            dataset.zos,
-            zos_daily_climatology_file,
-            daily_anom_zos_file,
-            num_workers=num_workers,
+    if daily_anom_zos_file is None:
+        zos_daily_anom = (
+            compute_clim_and_anom(dataset.zos)
+            .anom.rename("zos")
+            .chunk(dict(time=500, lon=-1, lat=-1))
         )
-    zos_daily_anom = xarray.open_zarr(
-        daily_anom_zos_file, chunks=dict(time=500, lon=-1, lat=-1)
-    ).zos
+    else:
+        if not daily_anom_zos_file.exists():
+            write_clim_and_anom(
+                dataset.zos,
+                zos_daily_climatology_file,
+                daily_anom_zos_file,
+                num_workers=num_workers,
+            )
+        zos_daily_anom = xarray.open_zarr(
+            daily_anom_zos_file, chunks=dict(time=500, lon=-1, lat=-1)
+        ).zos
     # Compute Geostrophic Velocities
     u_g, v_g = compute_geostrophic_velocities(zos_daily_anom, latlon_units="degrees")
     eke = 0.5 * (u_g**2 + v_g**2)
@@ -4,12 +4,63 @@ from pathlib import Path
 
 import xarray
 from dask.diagnostics import ProgressBar
+from numcodecs import Blosc
 
 from eerieview.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def get_netcdf_compression(complevel: int = 1) -> dict:
+    """Return the netCDF encoding options to compress a variable.
+
+    Zstandard is used when the netCDF library supports it, as it is several times
+    faster than zlib for a similar compression ratio. Otherwise zlib is used.
+
+    Parameters
+    ----------
+    complevel : int, optional
+        The compression level. Defaults to 1.
+
+    Returns
+    -------
+    dict
+        The compression options, to be added to the encoding of a variable.
+    """
+    try:
+        import netCDF4
+
+        has_zstandard = bool(netCDF4.__has_zstandard_support__)
+    except (ImportError, AttributeError):
+        has_zstandard = False
+    if has_zstandard:
+        return dict(compression="zstd", complevel=complevel)
+    return dict(zlib=True, complevel=complevel)
+
+
+def _compute_with_progress(delayed_write, show_progress: bool = False):
+    """Compute a delayed write, showing its progress if requested.
+
+    With a distributed client the progress of the future is shown with
+    distributed.progress. Otherwise the local ProgressBar is used, redrawn once per
+    second so its timer thread does not compete for the GIL with the computation.
+    """
+    if not show_progress:
+        delayed_write.compute()
+        return
+    try:
+        from distributed import get_client, progress
+
+        client = get_client()
+    except (ImportError, ValueError):
+        with ProgressBar(dt=1.0):
+            delayed_write.compute()
+        return
+    future = client.compute(delayed_write)
+    progress(future)
+    future.result()
+
+
 def safe_to_netcdf(
     dataset: xarray.Dataset,
     output_path: Path,
@@ -22,25 +73,10 @@ def safe_to_netcdf(
     with tempfile.TemporaryDirectory(dir=output_path.parent) as tmpdir:
         temp_output_path = Path(tmpdir, output_path.name)
         logger.info(f"Writing netCDF to {temp_output_path}")
-
-        # ProgressBar only works with the local scheduler.
-        # It can interfere with distributed, so we check if a client is active.
-        use_progress = show_progress
-        if use_progress:
-            try:
-                from distributed import get_client
-
-                get_client()
-                logger.debug("Distributed client detected, disabling ProgressBar")
-                use_progress = False
-            except (ImportError, ValueError):
-                pass
-
-        if use_progress:
-            with ProgressBar():
-                dataset.to_netcdf(temp_output_path, encoding=encoding)
-        else:
-            dataset.to_netcdf(temp_output_path, encoding=encoding)
+        delayed_write = dataset.to_netcdf(
+            temp_output_path, encoding=encoding, compute=False
+        )
+        _compute_with_progress(delayed_write, show_progress)
         logger.info(f"Write complete. Moving {temp_output_path} to {output_path}")
         shutil.move(temp_output_path, output_path)
 
@@ -64,6 +100,13 @@ def safe_to_zarr(
         zarr_encoding = {}
         for var, enc in encoding.items():
             z_enc = enc.copy()
+            # The zlib compression of NetCDF is translated to blosc with zstd, which
+            # compresses at a similar ratio and is much faster to write and read.
+            if z_enc.get("zlib", False) and "compressor" not in z_enc:
+                shuffle = Blosc.SHUFFLE if z_enc.get("shuffle") else Blosc.NOSHUFFLE
+                z_enc["compressor"] = Blosc(
+                    cname="zstd", clevel=z_enc.get("complevel", 1), shuffle=shuffle
+                )
             # NetCDF-specific keys that Zarr doesn't support
             # We also remove chunks/chunksizes to avoid alignment issues with Dask
             for key in ["zlib", "complevel", "shuffle", "chunksizes", "chunks"]:
@@ -71,23 +114,10 @@ def safe_to_zarr(
             zarr_encoding[var] = z_enc
 
     logger.info(f"Writing Zarr to {temp_output_path}")
-
-    use_progress = show_progress
-    if use_progress:
-        try:
-            from distributed import get_client
-
-            get_client()
-            logger.debug("Distributed client detected, disabling ProgressBar")
-            use_progress = False
-        except (ImportError, ValueError):
-            pass
-
-    if use_progress:
-        with ProgressBar():
-            dataset.to_zarr(temp_output_path, encoding=zarr_encoding, consolidated=True)
-    else:
-        dataset.to_zarr(temp_output_path, encoding=zarr_encoding, consolidated=True)
+    delayed_write = dataset.to_zarr(
+        temp_output_path, encoding=zarr_encoding, consolidated=True, compute=False
+    )
+    _compute_with_progress(delayed_write, show_progress)
 
     logger.info(f"Write complete. Renaming {temp_output_path} to {output_path}")
     if output_path.exists():
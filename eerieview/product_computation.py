@@ -28,7 +28,7 @@ from eerieview.data_processing import (
     aggtime,
     define_extra_dimensions,
     delete_wrong_attrs,
-    filter_time_axis,
+    filter_time_axes,
     fix_coords,
     fix_units,
     get_time_filters,
@@ -38,7 +38,7 @@ from eerieview.data_processing import (
 )
 from eerieview.exceptions import EmptySliceError
 from eerieview.grids import get_grid_dataset
-from eerieview.io_utils import safe_to_netcdf
+from eerieview.io_utils import get_netcdf_compression, safe_to_netcdf
 from eerieview.logger import get_logger
 from eerieview.metadata import fix_attributes
 from eerieview.trends.api import compute_trend
@@ -87,7 +87,7 @@ def get_time_series(
         varname=varname,
     )
     varattrs = dataset_cmor_filtered[varname].attrs
-    dataset_ts = aggregate_regions(dataset_cmor_resampled, region_set).compute()
+    dataset_ts = aggregate_regions(dataset_cmor_resampled, region_set)
     # Set time to the first day of year year so all the time filters are aligned
     dataset_ts["time"] = [datetime(d.year, 1, 1) for d in dataset_ts.time.to_index()]
     dataset_ts[varname].attrs.update(varattrs)
@@ -188,8 +188,9 @@ def get_model_decadal_product(
         final_member = member.slug
 
         # Iterate through each time filter and period
-        for time_filter in time_filters:
-            dataset_cmor_filtered = filter_time_axis(dataset_cmor, time_filter)
+        member_products = []
+        datasets_filtered = filter_time_axes(dataset_cmor, time_filters)
+        for time_filter, dataset_cmor_filtered in zip(time_filters, datasets_filtered):
             for period in periods.all_list:
                 logger.info(
                     f"Computing {product} for {varname} {member} {period} and "
@@ -203,20 +204,24 @@ def get_model_decadal_product(
                 dataset_product = fix_coords(dataset_cmor_filtered, dataset_product)
                 # Remove problematic attributes from the dataset
                 dataset_product = delete_wrong_attrs(dataset_product)
-                # Get a 0.25 degree target grid
-                grid_dataset = get_grid_dataset(0.25)
-                dataset_product = dataset_product.regrid.conservative(
-                    grid_dataset, latitude_coord="lon"
-                )
-
                 # Define extra dimensions for metadata (member, time filter, period)
                 dataset_product = define_extra_dimensions(
                     dataset_product,
                     final_member,
                     time_filter,
                     period,
-                ).drop_vars(["depth"], errors="ignore")
-                climatologies.append(dataset_product)
+                )
+                member_products.append(dataset_product)
+
+        # Regrid all the products of the member at once to a 0.25 degree target grid,
+        # so the regridding weights are computed once per member.
+        grid_dataset = get_grid_dataset(0.25)
+        dataset_member = (
+            xarray.merge(member_products)
+            .regrid.conservative(grid_dataset, latitude_coord="lon")
+            .drop_vars(["depth"], errors="ignore")
+        )
+        climatologies.append(dataset_member)
 
     # Merge all individual climatologies/products into a single dataset
     # Using reduce for efficient merging of multiple xarray Datasets
@@ -228,9 +233,8 @@ def get_model_decadal_product(
     # Fix global and variable attributes for compliance
     final_dataset = fix_attributes(final_dataset, varname)
 
-    # Optimize Dask graph and write the final dataset to NetCDF
+    # Write the final dataset to NetCDF. The graph is optimized when it is computed.
     logger.info(f"Writing climatologies to {output_path}")
-    final_dataset = dask.optimize(final_dataset)[0]
     safe_to_netcdf(final_dataset, output_path, show_progress=True)
     return output_path
 
@@ -296,7 +300,9 @@ def get_member_dataset(
             )
         else:
             raise
-    logger.info(dataset)
+    logger.debug(
+        f"Dataset sizes {dict(dataset.sizes)}, variables {list(dataset.data_vars)}"
+    )
     # Handle realization dimension if present by averaging
     if "realization" in dataset:
         logger.info("Realization dimension detected. Averaging the ensemble members.")
@@ -416,13 +422,14 @@ def get_model_time_series(
         dataset_cmor = to_cmor_names(dataset, rawname, varname)
         # Convert the member string to a standardized slug for consistent dimension naming.
         final_member = member_obj.to_atmos().slug
+        # Filter the dataset's time axis based on each time filter.
+        datasets_filtered = filter_time_axes(dataset_cmor, time_filters)
         # Iterate through each time filter to generate different time series.
-        for time_filter in time_filters:
+        member_series = []
+        for time_filter, dataset_cmor_filtered in zip(time_filters, datasets_filtered):
             logger.info(
                 f"Computing time series for {member} and {time_filter.to_str()}"
             )
-            # Filter the dataset's time axis based on the current time filter.
-            dataset_cmor_filtered = filter_time_axis(dataset_cmor, time_filter)
             # Generate the time series, including regional aggregation.
             dataset_ts = get_time_series(
                 dataset_cmor_filtered, time_filter, varname, region_set
@@ -435,7 +442,12 @@ def get_model_time_series(
             dataset_ts = define_extra_dimensions(
                 dataset_ts, final_member, time_filter, "reference"
             )
+            member_series.append(dataset_ts)
 
+        # Compute the time series of all the time filters together, so the input
+        # data of the member is read only once.
+        member_datasets = []
+        for dataset_ts in dask.compute(*member_series):
             # --- Anomaly Calculation ---
             # Define the start and end dates for the reference period.
             start_date_str = f"{reference_period[0]}-01-01"
@@ -445,7 +457,7 @@ def get_model_time_series(
                 dataset_ts[varname]
                 .sel(time=slice(start_date_str, end_date_str))
                 .mean(dim="time")
-            ).compute()
+            )
             # Compute the anomaly by subtracting the reference climatology.
             dataset_ts[varname + "_anom"] = dataset_ts[varname] - ref_clim
 
@@ -455,43 +467,49 @@ def get_model_time_series(
                 # Combine 'member' and 'realization' into a new 'memberrea' multi-index dimension.
                 dataset_ts = dataset_ts.stack(memberrea=["member", "realization"])
                 # Create a string representation for the combined member-realization index.
-                dataset_ts["memberrea_str"] = xarray.DataArray(
-                    [
-                        "_".join([str(i) for i in mi])
-                        for mi in dataset_ts.memberrea.to_index()
-                    ],
-                    dims=["memberrea"],
+                memberrea_frame = (
+                    dataset_ts.memberrea.to_index().to_frame(index=False).astype(str)
                 )
-                # Drop the original 'member', 'realization', and the temporary 'memberrea' dimensions.
-                dataset_ts = dataset_ts.drop_vars(
-                    ["member", "realization", "memberrea"]
-                )
-                # Rename the 'memberrea' dimension to 'member' for consistency.
-                # Transpose dimensions to a desired order.
+                memberrea_str = (
+                    memberrea_frame["member"] + "_" + memberrea_frame["realization"]
+                ).to_numpy(dtype=str)
+                # Replace the multi-index by the strings as the new 'member' coordinate
+                # and transpose dimensions to a desired order.
                 dataset_ts = (
-                    dataset_ts.rename_dims(memberrea="member")
-                    .rename(memberrea_str="member")
+                    dataset_ts.drop_vars(["memberrea", "member", "realization"])
+                    .assign_coords(memberrea=memberrea_str)
+                    .rename(memberrea="member")
                     .transpose("period", "member", "time_filter", "time", "region")
                 )
-                # Set the new 'member' as a coordinate for easier indexing.
-                dataset_ts = dataset_ts.set_coords(["member"]).set_xindex("member")
-            time_series_datasets.append(dataset_ts)
+            member_datasets.append(dataset_ts)
+        time_series_datasets.append(
+            xarray.concat(member_datasets, dim="time_filter", join="outer")
+        )
 
-    # Merge all individual time series datasets into a single xarray Dataset.
-    final_dataset = xarray.merge(time_series_datasets)
+    # Join the time series of all the members into a single xarray Dataset.
+    # Concatenating is linear in the number of datasets, unlike merging, which
+    # aligns all of them. They are sorted as merge would do, to keep the order of
+    # the outputs.
+    final_dataset = xarray.concat(
+        time_series_datasets, dim="member", join="outer"
+    ).sortby(["member", "time_filter"])
     # Fix global and variable attributes for compliance.
     final_dataset = fix_attributes(final_dataset, varname).squeeze()
-    # Optimize the Dask graph for the final dataset before writing.
+    # The time series are already in memory, there is no Dask graph to optimize.
     logger.info(f"Writing time series to {output_path}")
-    final_dataset = dask.optimize(final_dataset)[0]
 
     # Define encoding options for the NetCDF variables to optimize storage.
-    # Chunking is specified for better I/O performance.
+    # Chunking is specified for better I/O performance. Each chunk holds all the
+    # regions of a time filter, as small chunks compress and write poorly. The
+    # chunks follow the dimensions of the variable, as squeeze can drop some of them.
+    sizes = final_dataset.sizes
     encoding_variable = dict(
         dtype="float32",
-        zlib=True,
-        complevel=1,
-        chunksizes=(final_dataset.member.size, 1, final_dataset.time.size, 3),
+        **get_netcdf_compression(complevel=1),
+        chunksizes=tuple(
+            1 if dim == "time_filter" else sizes[dim]
+            for dim in final_dataset[varname].dims
+        ),
     )
     # Apply encoding to both the main variable and its anomaly.
     encoding = {varname: encoding_variable, varname + "_anom": encoding_variable}
@@ -0,0 +1,33 @@
+"""
+Student's t distribution functions callable from cached numba functions.
+
+numba cannot call scipy directly, so the scipy cython kernels are used through their
+C addresses. Embedding those addresses in the compiled code (as numba_stats does)
+makes the functions that use them impossible to cache, and they get compiled again
+in every new process. Here the addresses are registered as named symbols in LLVM at
+import time, so the compiled code only references the symbol names and numba can
+cache it on disk.
+"""
+
+from llvmlite import binding
+from numba import types
+from numba.extending import get_cython_function_address
+from scipy.special import cython_special
+
+
+def _bind_cython_special(name: str) -> types.ExternalFunction:
+    # scipy >= 1.12 exports fused versions of some special functions, the first
+    # one is the double precision one.
+    fuse_name = f"__pyx_fuse_0{name}"
+    if fuse_name not in cython_special.__pyx_capi__:
+        fuse_name = name
+    address = get_cython_function_address("scipy.special.cython_special", fuse_name)
+    symbol = f"eerieview_{name}"
+    binding.add_symbol(symbol, address)
+    return types.ExternalFunction(symbol, types.float64(types.float64, types.float64))
+
+
+# stdtr(df, t): Student's t cumulative distribution function.
+stdtr = _bind_cython_special("stdtr")
+# stdtrit(df, p): inverse of stdtr with respect to t.
+stdtrit = _bind_cython_special("stdtrit")
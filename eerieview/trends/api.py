@@ -2,19 +2,24 @@ import dask
 import numpy
 import xarray
 
-from eerieview.trends.regression import ltr_OLSdofrNaN
+from eerieview.trends.regression import LTR_OUTPUTS, ltr_OLSdofrNaN_map
+
+_TREND_COLUMN = LTR_OUTPUTS.index("b")
+_PVALUE_COLUMN = LTR_OUTPUTS.index("pval")
 
 
 def _compute_trend(input_arr, years):
     # xarray apply_ufunct moves the core dimensions to the right! That is why time
-    # goes at the right.
-    res = ltr_OLSdofrNaN(years, input_arr)
-    return res[0], res[5]
-
-
-_compute_trend = numpy.vectorize(
-    _compute_trend, otypes=[numpy.float32, numpy.float32], signature="(nt),(nt)->(),()"
-)
+    # goes at the right. The years are the same for all the grid points.
+    ntimes = input_arr.shape[-1]
+    # The numba kernel is compiled only for C-contiguous float64 arrays.
+    x = numpy.ascontiguousarray(years.reshape(-1, ntimes)[0], dtype=numpy.float64)
+    y = numpy.ascontiguousarray(input_arr.reshape(-1, ntimes), dtype=numpy.float64)
+    res = ltr_OLSdofrNaN_map(x, y, 0.90)
+    shape = input_arr.shape[:-1]
+    trend = res[:, _TREND_COLUMN].astype(numpy.float32).reshape(shape)
+    p_value = res[:, _PVALUE_COLUMN].astype(numpy.float32).reshape(shape)
+    return trend, p_value
 
 
 def compute_trend(
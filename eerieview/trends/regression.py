@@ -1,9 +1,35 @@
 import numba
 import numpy
-from numba_stats import t
-
-
-@numba.njit(nogil=True, parallel=False, cache=True)
+from numba import types
+
+from eerieview.trends._special import stdtr, stdtrit
+
+# Let LLVM reassociate the OLS sums and emit FMA. The flags that assume there are
+# no NaN or Inf values are left out on purpose, the NaN checks are needed here.
+FASTMATH_FLAGS = {"reassoc", "contract", "arcp", "nsz"}
+_ARRAY = types.float64[::1]
+MKLR_SIGNATURE = types.UniTuple(types.float64, 4)(_ARRAY, _ARRAY)
+LTR_SIGNATURE = types.void(_ARRAY, _ARRAY, types.float64, _ARRAY)
+LTR_MAP_SIGNATURE = types.float64[:, ::1](_ARRAY, types.float64[:, ::1], types.float64)
+# Order of the statistics written by ltr_OLSdofrNaN in its output array.
+LTR_OUTPUTS = (
+    "b",
+    "cinthw",
+    "sig",
+    "DOFr",
+    "rho",
+    "pval",
+    "irrc",
+    "N",
+    "a",
+    "Na",
+    "Nc",
+)
+
+
+@numba.njit(
+    MKLR_SIGNATURE, nogil=True, parallel=False, cache=True, fastmath=FASTMATH_FLAGS
+)
 def mklr(x: numpy.ndarray, y: numpy.ndarray) -> tuple:
     """
     Perform univariate linear regression of y on x.
@@ -72,8 +98,10 @@ def mklr(x: numpy.ndarray, y: numpy.ndarray) -> tuple:
     return (r0, sig0, r1, sig1)
 
 
-@numba.njit(cache=True, parallel=False, nogil=True)
-def ltr_OLSdofrNaN(x, y, p=0.90) -> tuple:
+@numba.njit(
+    LTR_SIGNATURE, cache=True, parallel=False, nogil=True, fastmath=FASTMATH_FLAGS
+)
+def ltr_OLSdofrNaN(x, y, p, out):
     """
     Compute linear trend slopes, their confidence intervals and some other related stats.
 
@@ -83,22 +111,26 @@ def ltr_OLSdofrNaN(x, y, p=0.90) -> tuple:
     Please note:
     (1) the time grid is expected to be uniform, and
     (2) missing data values contain NaN
-    (3) if this function is called with 2 input parameters only, p is assumed
-        to be NaN, and NaN is returned for cinthw; other output parameters
-        are unaffected
-    (4) this function uses an external function mklr.m for the OLS regression
+    (3) this function uses an external function mklr.m for the OLS regression
 
     Parameters
     ----------
-    x : array_like
-        A 1-D array of time values (a uniform grid).
-    y : array_like
-        A 1-D array of data values (NaN in place of missing values).
-    p : float, optional
+    x : numpy.ndarray
+        A 1-D C-contiguous float64 array of time values (a uniform grid).
+    y : numpy.ndarray
+        A 1-D C-contiguous float64 array of data values (NaN in place of missing
+        values).
+    p : float
         A confidence level for the uncertainty interval (0 < p < 1).
+    out : numpy.ndarray
+        A 1-D C-contiguous float64 array of length 11 where the statistics are
+        written. It is usually a row of the output of ltr_OLSdofrNaN_map.
 
     Returns
     -------
+    None
+        Nothing is returned, the statistics below are written to `out`, in this
+        order (see LTR_OUTPUTS).
     b : float
         The estimated slope of the linear trend.
     cinthw : float or NaN
@@ -120,7 +152,8 @@ def ltr_OLSdofrNaN(x, y, p=0.90) -> tuple:
             irrc = 10, DOFr < 3; in this case results of the calculation are not
                         recommended for use; when DOFr-->2-0, values of sig and cinthw
                         tend to infinity and pval-->1 (Inf are returned for sig and
-                        cinthw and 1 for pval when DOFr <= 2)
+                        cinthw and 1 for pval when DOFr <= 2.5, as the t-test is
+                        not meaningful below 0.5 reduced degrees of freedom)
             irrc = 100, rho could not be estimated (NaN are returned for rho, Inf for
                         sig and cinthw, and 1 for pval)
             irrc = 1000, no calculation is done b/c number of available data
@@ -197,8 +230,17 @@ def ltr_OLSdofrNaN(x, y, p=0.90) -> tuple:
         if Nc < 2:
             irrc = irrc + 100
         else:
-            Ec = EE[ic, :]
-            rho = numpy.corrcoef(Ec[:, 0], Ec[:, 1])[0, 1]
+            # Pearson correlation from sums of products, cheaper than building the
+            # 2x2 matrix of numpy.corrcoef to keep one of its elements.
+            e0 = EE[ic, 0]
+            e1 = EE[ic, 1]
+            s0 = e0.sum()
+            s1 = e1.sum()
+            num = (e0 * e1).sum() - s0 * s1 / Nc
+            den = numpy.sqrt(
+                ((e0 * e0).sum() - s0 * s0 / Nc) * ((e1 * e1).sum() - s1 * s1 / Nc)
+            )
+            rho = num / den
 
         if rho != rho:
             irrc += 100
@@ -216,25 +258,51 @@ def ltr_OLSdofrNaN(x, y, p=0.90) -> tuple:
                 irrc += 10
 
             # Step 7
-            if DOFr > 2:
+            # With DOFr - 2 close to 0 the t distribution functions explore extreme
+            # tails, which is slow and gives meaningless values.
+            if DOFr > 2.5:
                 # Adjust estimated standard error in the trend slope
                 sig = sb * numpy.sqrt((Na - 2) / (DOFr - 2))
-                pval = (
-                    2
-                    * (
-                        1
-                        - t.cdf(
-                            numpy.array([numpy.absolute(b) / sig]),
-                            DOFr - 2,
-                            loc=0.0,
-                            scale=1.0,
-                        )
-                    )[0]
-                )
+                pval = 2 * (1 - stdtr(DOFr - 2, numpy.absolute(b) / sig))
                 # half-width of the (p*100)% confidence interval for b:
-                cinthw = (
-                    sig
-                    * t.ppf(numpy.array([0.5 + p / 2]), DOFr - 2, loc=0.0, scale=1.0)[0]
-                )
+                cinthw = sig * stdtrit(DOFr - 2, 0.5 + p / 2)
+
+    out[0] = b
+    out[1] = cinthw
+    out[2] = sig
+    out[3] = DOFr
+    out[4] = rho
+    out[5] = pval
+    out[6] = irrc
+    out[7] = N
+    out[8] = a
+    out[9] = Na
+    out[10] = Nc
+
+
+@numba.njit(
+    LTR_MAP_SIGNATURE, cache=True, parallel=True, nogil=True, fastmath=FASTMATH_FLAGS
+)
+def ltr_OLSdofrNaN_map(x, y, p):
+    """
+    Apply ltr_OLSdofrNaN to many time series in parallel.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A 1-D C-contiguous float64 array of time values, shared by all the series.
+    y : numpy.ndarray
+        A 2-D C-contiguous float64 array (series, time) of data values.
+    p : float
+        A confidence level for the uncertainty interval (0 < p < 1).
 
-    return b, cinthw, sig, DOFr, rho, pval, irrc, N, a, Na, Nc
+    Returns
+    -------
+    numpy.ndarray
+        A (series, 11) array with the statistics of each series, the columns are
+        ordered as in LTR_OUTPUTS.
+    """
+    out = numpy.empty((y.shape[0], len(LTR_OUTPUTS)))
+    for i in numba.prange(y.shape[0]):
+        ltr_OLSdofrNaN(x, y[i], p, out[i])
+    return out
@@ -3,11 +3,26 @@ import os
 import s3fs
 
 
-def get_filesystem():
+def get_filesystem(
+    use_listings_cache: bool = False, max_pool_connections: int = 64
+) -> s3fs.S3FileSystem:
+    """Return an S3 filesystem configured from the S3_* environment variables.
+
+    Parameters
+    ----------
+    use_listings_cache : bool, optional
+        Whether s3fs should cache directory listings. Disabled by default so
+        stores written in the same session are always visible.
+    max_pool_connections : int, optional
+        Size of the HTTP connection pool. The zarr chunks are written by many dask
+        threads at the same time, and with the botocore default of 10 connections
+        most of them wait for a free connection instead of uploading.
+    """
     fs = s3fs.S3FileSystem(
         key=os.environ["S3_KEY"],
         secret=os.environ["S3_SECRET"],
         client_kwargs={"endpoint_url": os.environ["S3_ENDPOINT_URL"]},
-        use_listings_cache=False,
+        config_kwargs={"max_pool_connections": max_pool_connections},
+        use_listings_cache=use_listings_cache,
     )
     return fs
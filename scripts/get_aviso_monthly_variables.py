@@ -7,6 +7,7 @@ import dask
 import xarray
 from dotenv import load_dotenv
 
+from eerieview.data_processing import get_auto_chunks
 from eerieview.eke import DEFAULT_ENCODING, compute_monthly_eke
 from eerieview.io_utils import safe_to_netcdf, safe_to_zarr
 
@@ -22,18 +23,12 @@ def main_eke():
     daily_anom_zos_file = Path(storage_dir, "zos_anom_aviso_daily.nc")
     aviso_daily_zos_file = Path(storage_dir, "adt_aviso_daily.nc")
 
-    dataset = xarray.open_dataset(
-        aviso_daily_zos_file,
-        chunks=dict(time=1000, latitude=100, longitude=100),
-    ).rename(adt="zos", longitude="lon", latitude="lat")
-
-    zos_daily_climatology_file = Path(storage_dir, "zos_clim_aviso_dayofyear.nc")
-
-    eke_monthly = compute_monthly_eke(
-        dataset,
-        daily_anom_zos_file,
-        zos_daily_climatology_file,
+    dataset = xarray.open_dataset(aviso_daily_zos_file).rename(
+        adt="zos", longitude="lon", latitude="lat"
     )
+    dataset = dataset.chunk(get_auto_chunks(dataset))
+
+    eke_monthly = compute_monthly_eke(dataset, daily_anom_zos_file)
 
     timeindex = eke_monthly.time.to_index()
     mintime = f"{timeindex[0]:%Y%m}"
@@ -49,10 +44,10 @@ def main_zos():
     aviso_daily_zos_file = Path(storage_dir, "adt_aviso_daily.nc")
     aviso_monthly_zos_file = Path(storage_dir, "zos_AVISO_mon_199301-202206.nc")
 
-    dataset = xarray.open_dataset(
-        aviso_daily_zos_file,
-        chunks=dict(time=1000, latitude=100, longitude=100),
-    ).rename(adt="zos", longitude="lon", latitude="lat")
+    dataset = xarray.open_dataset(aviso_daily_zos_file).rename(
+        adt="zos", longitude="lon", latitude="lat"
+    )
+    dataset = dataset.chunk(get_auto_chunks(dataset))
 
     dataset_monthly = dataset.resample(time="MS").mean()
 
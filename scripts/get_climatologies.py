@@ -1,3 +1,4 @@
+import argparse
 import os
 from pathlib import Path
 
@@ -50,10 +51,12 @@ for different experimental setups (control, historical, AMIP).
 """
 
 
-def main_control(product: DecadalProduct):
+def main_control(product: DecadalProduct, members: list | None = None):
     location: InputLocation = "levante_cmor"
     reference_period = (1951, 1980)
     periods = [(1951, 1980), (1971, 2000), (1991, 2020), (2021, 2050)]
+    if members is None:
+        members = members_eerie_control_cmor
     periods_config = PeriodsConfig(reference_period, periods)
     output_dir = Path(os.environ["PRODUCTSDIR"], "decadal")
 
@@ -67,7 +70,7 @@ def main_control(product: DecadalProduct):
         get_model_decadal_product(
             varname=varname,
             output_dir=output_dir,
-            members=members_eerie_control_cmor,
+            members=members,
             periods=periods_config,
             product=product,
             experiment="control",
@@ -142,13 +145,14 @@ def main_hist(product: DecadalProduct, members: list | None = None):
         )
 
 
-def main_amip():
+def main_amip(product: DecadalProduct = "clim", members: list | None = None):
     location: InputLocation = "levante"
-    product: DecadalProduct = "clim"
     reference_period = (1981, 2010)
     periods = [(1991, 2020)]
     periods_config = PeriodsConfig(reference_period, periods)
     output_dir = Path(os.environ["PRODUCTSDIR"], "decadal")
+    if members is None:
+        members = members_eerie_hist_amip
     variables_amip = [v for v in VARIABLES if v not in ["eke", "zos", "sos"]]
     for varname in variables_amip:
         logger.info(f"Processing {varname} data for 'hist-amip' experiment")
@@ -156,7 +160,7 @@ def main_amip():
             varname=varname,
             location=location,
             output_dir=output_dir,
-            members=members_eerie_hist_amip,
+            members=members,
             periods=periods_config,
             product=product,
             experiment="hist-amip",
@@ -177,8 +181,46 @@ def members_with_eke_data(members: list) -> list:
     return result
 
 
+EXPERIMENT2MAIN = {
+    "control": main_control,
+    "hist": main_hist,
+    "future": main_future,
+    "hist-amip": main_amip,
+}
+EXPERIMENT2MEMBERS = {
+    "control": members_eerie_control_cmor,
+    "hist": members_eerie_hist_cmor,
+    "future": members_eerie_future_cmor,
+    "hist-amip": members_eerie_hist_amip,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute decadal climatologies and trends for EERIE experiments."
+    )
+    parser.add_argument(
+        "--experiment",
+        nargs="+",
+        choices=list(EXPERIMENT2MAIN),
+        default=["hist", "future"],
+    )
+    parser.add_argument(
+        "--product", nargs="+", choices=["clim", "trend"], default=["clim", "trend"]
+    )
+    parser.add_argument(
+        "--all-members",
+        action="store_true",
+        help="Do not restrict the members to those with pre-computed EKE.",
+    )
+    args = parser.parse_args()
+    for experiment in args.experiment:
+        members = EXPERIMENT2MEMBERS[experiment]
+        if not args.all_members and experiment != "hist-amip":
+            members = members_with_eke_data(members)
+        for product in args.product:
+            EXPERIMENT2MAIN[experiment](product, members=members)
+
+
 if __name__ == "__main__":
-    main_hist("clim", members=members_with_eke_data(members_eerie_hist_cmor))
-    main_hist("trend", members=members_with_eke_data(members_eerie_hist_cmor))
-    main_future("clim", members=members_with_eke_data(members_eerie_future_cmor))
-    main_future("trend", members=members_with_eke_data(members_eerie_future_cmor))
+    main()
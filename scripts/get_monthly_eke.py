@@ -3,7 +3,10 @@
 This needs significant resources (especially memory), try with 64G or 128G
 """
 
+import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import replace
 from pathlib import Path
 
@@ -27,6 +30,24 @@ load_dotenv()
 logger = get_logger(__name__)
 
 
+def get_eke_output_path(member: Member) -> Path:
+    """Return the path of the monthly EKE zarr store of a member."""
+    return Path(os.environ["DIAGSDIR"], f"eke_{member.to_atmos().slug}_monthly.zarr")
+
+
+def eke_output_exists(member: Member, existing: set[str] | None = None) -> bool:
+    """Check if the monthly EKE of a member exists, as zarr or netCDF.
+
+    If existing is given, it is the set of file names in DIAGSDIR and it is used
+    instead of checking the paths one by one.
+    """
+    output_path = get_eke_output_path(member)
+    candidates = (output_path, output_path.with_suffix(".nc"))
+    if existing is not None:
+        return any(path.name in existing for path in candidates)
+    return any(path.exists() for path in candidates)
+
+
 def compute_eke_for_member(
     member: Member,
     location: InputLocation,
@@ -46,14 +67,9 @@ def compute_eke_for_member(
         member = replace(member, cmor_table="HROday")
     # Get intermediate and final file names
     final_member = member.to_atmos().slug
-    output_path = Path(output_dir, f"eke_{final_member}_monthly.zarr")
-    zos_daily_climatology_file = Path(
-        output_dir, f"zos_clim_{final_member}_dayofyear.zarr"
-    )
+    output_path = get_eke_output_path(member)
     daily_anom_zos_file = Path(output_dir, f"zos_anom_{final_member}_daily.zarr")
-    if (
-        output_path.exists() or output_path.with_suffix(".nc").exists()
-    ) and not clobber:
+    if eke_output_exists(member) and not clobber:
         logger.info(f"{output_path} already exists")
     else:
         # Open the catalogue entry
@@ -70,19 +86,14 @@ def compute_eke_for_member(
             dataset, member, rawname = retry_get_entry_with_fixes(
                 catalogue, get_entry_dataset, location, member, rawname, varname
             )
-        # Rechunk before compute_monthly_eke.
-        # Pre-chunking to lat=50, lon=50 (matching the block
-        # size) reduces the number of dask tasks per block, even though the
-        # underlying stored chunks may be smaller.
-        dataset = dataset.chunk(dict(time=32, lat=50, lon=50))
+        # No rechunking here, compute_monthly_eke rechunks the data on disk chunks
+        # to the spatial tiles of the climatology in a single step.
         # Rename to CMOR names
         dataset_cmor = to_cmor_names(dataset, rawname, varname)
-        # Run computation
+        # Run computation. The daily anomalies are persisted as they are needed to
+        # compute the land mask (see data_access), the climatology is not.
         eke_monthly = compute_monthly_eke(
-            dataset_cmor,
-            daily_anom_zos_file,
-            zos_daily_climatology_file,
-            num_workers=num_workers,
+            dataset_cmor, daily_anom_zos_file, num_workers=num_workers
         )
         safe_to_zarr(
             eke_monthly,
@@ -92,23 +103,110 @@ def compute_eke_for_member(
         )
 
 
+def _compute_eke_for_member_str(
+    member_str: str, location: InputLocation, num_workers: int | None
+):
+    logger.info(f"Computing monthly EKE for {member_str}")
+    member = CmorEerieMember.from_string(member_str)
+    compute_eke_for_member(member, location, clobber=False, num_workers=num_workers)
+
+
+def _compute_members(
+    member_strs: list[str],
+    location: InputLocation,
+    num_workers: int | None,
+    parallel_members: int,
+) -> dict[str, Exception]:
+    """Compute the EKE of the members in a pool of processes.
+
+    Returns the errors of the members that failed, the others are not interrupted.
+    """
+    if num_workers is not None:
+        # Share the CPUs of the job among the members computed at the same time
+        num_workers = max(num_workers // parallel_members, 1)
+    errors = {}
+    with ProcessPoolExecutor(max_workers=parallel_members) as executor:
+        futures = {
+            executor.submit(
+                _compute_eke_for_member_str, member_str, location, num_workers
+            ): member_str
+            for member_str in member_strs
+        }
+        for future in as_completed(futures):
+            member_str = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(
+                    f"EKE computation failed for {member_str} with error {e}"
+                )
+                errors[member_str] = e
+    return errors
+
+
+MEMBER_GROUPS = {
+    "future": members_eerie_future_cmor,
+    "hist": members_eerie_hist_cmor,
+    "control": members_eerie_control_cmor,
+}
+
+
 def main():
+    parser = argparse.ArgumentParser(
+        description="Compute the monthly EKE of the EERIE CMOR members."
+    )
+    parser.add_argument(
+        "--parallel-members",
+        type=int,
+        default=1,
+        help="Number of members computed at the same time, each one in its own "
+        "process. Memory usage grows with it, as every member needs its own.",
+    )
+    parser.add_argument(
+        "--members",
+        nargs="+",
+        choices=list(MEMBER_GROUPS),
+        default=list(MEMBER_GROUPS),
+        help="Experiments whose members are computed.",
+    )
+    args = parser.parse_args()
     dask.config.set(scheduler="synchronous")
+    # Keep any dask scratch files on node-local storage when the job provides it
+    dask_tmp = os.environ.get("PBS_JOBFS") or os.environ.get("TMPDIR")
+    if dask_tmp:
+        dask.config.set({"temporary-directory": dask_tmp})
     num_workers = int(os.environ.get("SLURM_CPUS_PER_TASK", 0)) or None
     location: InputLocation = "levante_cmor"
-    all_members = (
-        members_eerie_future_cmor + members_eerie_hist_cmor + members_eerie_control_cmor
-    )
-    for member_str in all_members:
-        logger.info(f"Computing monthly EKE for {member_str}")
-        try:
-            member = CmorEerieMember.from_string(member_str)
-            compute_eke_for_member(
-                member, location, clobber=False, num_workers=num_workers
-            )
-        except Exception as e:
-            raise
-            #            logger.warning(f"EKE computation failed for {member_str} with error {e}")
+    all_members = [m for group in args.members for m in MEMBER_GROUPS[group]]
+    # Drop the members already computed before starting any process. The output
+    # directory is listed once instead of checking each member's files, as
+    # metadata operations are slow on the shared filesystem.
+    existing = set(os.listdir(os.environ["DIAGSDIR"]))
+    done = [
+        m
+        for m in all_members
+        if eke_output_exists(CmorEerieMember.from_string(m), existing)
+    ]
+    if done:
+        logger.info(f"Skipping members with existing EKE output: {done}")
+    all_members = [m for m in all_members if m not in done]
+    errors = _compute_members(all_members, location, num_workers, args.parallel_members)
+    # A process killed by the OOM killer breaks the pool, and all the members still
+    # pending fail with it. Those and the ones that ran out of memory are retried
+    # once, one at a time so each one has all the memory of the job. Finished members
+    # are skipped, as their output already exists.
+    to_retry = [
+        member_str
+        for member_str, error in errors.items()
+        if isinstance(error, (MemoryError, BrokenProcessPool))
+    ]
+    if to_retry:
+        logger.info(f"Retrying {to_retry} one at a time")
+        for member_str in to_retry:
+            del errors[member_str]
+        errors.update(_compute_members(to_retry, location, num_workers, 1))
+    if errors:
+        raise RuntimeError(f"EKE computation failed for {list(errors)}")
 
 
 if __name__ == "__main__":
@@ -10,7 +10,7 @@ from eerieview.data_access import get_obs_dataset
 from eerieview.data_models import DecadalProduct, PeriodsConfig
 from eerieview.data_processing import (
     define_extra_dimensions,
-    filter_time_axis,
+    filter_time_axes,
     fix_units,
     get_time_filters,
 )
@@ -79,39 +79,45 @@ def get_obs_decadal_product(
     dataset = get_obs_dataset_fun(obsdir, rawname).rename({rawname: varname})
     dataset = fix_units(dataset, varname, product)
 
+    # Filter the dataset's time axis based on each time filter.
+    datasets_filtered = filter_time_axes(dataset, time_filters)
     # Iterate through each defined time filter (e.g., annual, seasonal).
-    for time_filter in time_filters:
+    for time_filter, dataset_filtered in zip(time_filters, datasets_filtered):
         logger.info(f"Computing {product} for time filter: {time_filter.to_str()}")
-        # Filter the dataset's time axis based on the current time filter.
-        dataset_filtered = filter_time_axis(dataset, time_filter)
 
         # Iterate through each period defined in PeriodsConfig.
         for period in periods.all_list:
             # Get the specific product (climatology or trend)
             dataset_product = get_decadal_product_or_fill_with_nan(
                 dataset_filtered, period, product, varname
-            ).compute()
+            )
 
             # Define and add extra dimensions (member, period, time_filter) for metadata.
             # 'ERA5' is hardcoded as the member name here for observational data.
             dataset_product = define_extra_dimensions(
                 dataset_product, "ERA5", time_filter, period
             )
-
-            # Get a regular grid dataset for regridding.
-            grid_dataset = get_grid_dataset(0.25)
-            # Regrid the product dataset to the common high-resolution grid using conservative regridding.
-            dataset_product = dataset_product.regrid.conservative(
-                grid_dataset, latitude_coord="lon"
-            )
-
-            # Fix units of the variable if necessary (e.g., temperature from K to degC, precipitation units).
-
             climatologies.append(dataset_product)
 
-    # Merge all individual product datasets into a single xarray Dataset.
-    final_dataset = xarray.merge(climatologies).squeeze()
-    final_dataset = dask.optimize(final_dataset)[0]
+    # Compute all the products together, so the input data they share is read once.
+    climatologies = dask.compute(*climatologies)
+    # Join the products along their period and time filter dimensions. Concatenating
+    # is linear in the number of products, unlike merging, which aligns all of them.
+    # They are sorted as merge would do, to keep the order of the outputs.
+    nperiods = len(periods.all_list)
+    final_dataset = xarray.concat(
+        [
+            xarray.concat(climatologies[i : i + nperiods], dim="period")
+            for i in range(0, len(climatologies), nperiods)
+        ],
+        dim="time_filter",
+    ).sortby(["period", "time_filter"])
+    # Regrid all the products at once to the common high-resolution grid using
+    # conservative regridding, so the regridding weights are computed only once.
+    grid_dataset = get_grid_dataset(0.25)
+    final_dataset = final_dataset.regrid.conservative(
+        grid_dataset, latitude_coord="lon"
+    ).squeeze()
 
     # --- Anomaly Calculation ---
     # Retrieve the reference period from the PeriodsConfig.
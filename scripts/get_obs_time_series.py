@@ -10,10 +10,10 @@ from eerieview.constants import CMOR2C3SATLAS
 from eerieview.data_access import get_obs_dataset
 from eerieview.data_processing import (
     define_extra_dimensions,
-    filter_time_axis,
+    filter_time_axes,
     get_time_filters,
 )
-from eerieview.io_utils import safe_to_netcdf
+from eerieview.io_utils import get_netcdf_compression, safe_to_netcdf
 from eerieview.logger import get_logger
 from eerieview.metadata import fix_attributes
 from eerieview.product_computation import get_time_series
@@ -80,13 +80,14 @@ def get_obs_time_series(
     # Rename the raw variable to its CMOR-compliant name.
     dataset_cmor = to_cmor_names(dataset, rawname, varname)
 
+    # Filter the dataset's time axis based on each time filter (e.g., select seasons).
+    datasets_filtered = filter_time_axes(dataset_cmor, time_filters)
     # Process the dataset for each defined time filter.
-    for time_filter in time_filters:
+    series = []
+    for time_filter, dataset_cmor_filtered in zip(time_filters, datasets_filtered):
         logger.info(
             f"Computing time series for {varname} {source} and {time_filter.to_str()}."
         )
-        # Filter the dataset's time axis based on the current time filter (e.g., select seasons).
-        dataset_cmor_filtered = filter_time_axis(dataset_cmor, time_filter)
         # Generate the time series, including spatial aggregation by region.
         dataset_ts = get_time_series(
             dataset_cmor_filtered, time_filter, varname, region_set=region_set
@@ -97,47 +98,55 @@ def get_obs_time_series(
         dataset_ts = define_extra_dimensions(
             dataset_ts, source, time_filter, period="reference"
         )
+        series.append(dataset_ts)
 
+    # Compute the time series of all the time filters together, so the input data
+    # is read only once.
+    for dataset_ts in dask.compute(*series):
         # --- Anomaly Calculation ---
         # Define the start and end dates for the reference period slice.
         start_date_str = f"{reference_period[0]}-01-01"
         end_date_str = f"{reference_period[1]}-12-31"
 
         # Calculate the climatological mean over the specified reference period.
-        # `.compute()` is called here to trigger immediate Dask computation for the climatology.
         ref_clim = (
             dataset_ts[varname]
             .sel(time=slice(start_date_str, end_date_str))
             .mean(dim="time")
-        ).compute()
+        )
         # Compute the anomaly by subtracting the reference climatology from the time series.
         dataset_ts[varname + "_anom"] = dataset_ts[varname] - ref_clim
         # Append the processed time series dataset to the list.
         time_series_datasets.append(dataset_ts)
 
-    # Merge all individual time series datasets into a single xarray Dataset.
-    final_dataset = xarray.merge(time_series_datasets)
+    # Join the time series of all the time filters into a single xarray Dataset,
+    # sorted by time filter as merge would do.
+    final_dataset = xarray.concat(
+        time_series_datasets, dim="time_filter", join="outer"
+    ).sortby("time_filter")
     # Add the reference period to the global attributes for metadata.
     final_dataset.attrs["reference_period"] = str(reference_period)
     # Fix global and variable attributes for compliance.
     final_dataset = fix_attributes(final_dataset, varname).squeeze()
-    # Optimize the Dask computation graph for the final dataset.
+    # The time series are already in memory, there is no Dask graph to optimize.
     logger.info(f"Writing time series to {output_path}.")
-    final_dataset = dask.optimize(final_dataset)[0]
 
     # Define encoding options for the NetCDF variables to optimize storage.
     # `chunksizes` are set for efficient I/O, assuming certain dimension orders.
+    # Each chunk holds all the regions of a time filter, small chunks compress poorly.
+    # The chunks follow the dimensions of the variable, as squeeze can drop some.
+    sizes = final_dataset.sizes
     encoding_variable = dict(
         dtype="float32",
-        zlib=True,
-        complevel=1,
-        chunksizes=(1, final_dataset.time.size, 3),
+        **get_netcdf_compression(complevel=1),
+        chunksizes=tuple(
+            1 if dim == "time_filter" else sizes[dim]
+            for dim in final_dataset[varname].dims
+        ),
     )
     # Apply encoding to both the main variable and its anomaly variable.
     encoding = {varname: encoding_variable, varname + "_anom": encoding_variable}
 
-    # Print statement for debugging, can be removed in production.
-    print(f"Writing output to {output_path}")
     # Safely write the final dataset to a NetCDF file with progress bar.
     safe_to_netcdf(final_dataset, output_path, encoding=encoding, show_progress=True)
     return output_path
@@ -1,10 +1,12 @@
 """PLot stripes figures for the menu combinations to help with the QA."""
 
+import ast
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pandas
-import seaborn as sns
 import xarray
 from dotenv import load_dotenv
 from matplotlib import pyplot
@@ -18,30 +20,58 @@ load_dotenv()
 logger = get_logger(__name__)
 
 
+def open_menu_zarr(fs, zarr_path: str) -> xarray.Dataset | None:
+    """Open a zarr store of the menus, returning None if it can not be read."""
+    print(f"Reading {zarr_path}")
+    try:
+        return xarray.open_zarr(fs.get_mapper(zarr_path), consolidated=True)
+    except Exception as e:
+        logger.error(f"Could not read {zarr_path}, failed with error: {e}")
+        return None
+
+
 def main():
     menus = pandas.read_excel("eerie_menus.xlsx")
+    # The variables are stored as the text of a Python list
+    menus["variables"] = menus["variables"].map(ast.literal_eval)
     fs = get_filesystem()
     s3_bucket = os.environ["S3_BUCKET"]
+    rows = list(menus.itertuples(index=False))
+    zarr_paths = [f"{s3_bucket}/{row.zarr}" for row in rows]
+
+    # Opening a store is dominated by the latency of the S3 metadata requests, so
+    # the stores are opened concurrently while the figures are plotted.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        datasets = executor.map(partial(open_menu_zarr, fs), zarr_paths)
+        for row, dataset in zip(rows, datasets):
+            plot_menu_row(row, dataset)
+
+
+def plot_menu_row(row, dataset: xarray.Dataset | None):
+    print(row)
+    product = row.product
+    dataset_name = row.dataset
+    if dataset is None:
+        return
+    if product == "ts":
+        dataset["time"] = dataset.time.dt.year
+        print(dataset)
+
+    for variable in row.variables:
+        plot_variable(dataset, dataset_name, product, row, variable)
+        if product != "trend":
+            plot_variable(dataset, dataset_name, product, row, variable + "_anom")
+
 
-    for row in menus.itertuples(index=False):
-        print(row)
-        zarr_path = f"{s3_bucket}/{row.zarr}"
-        product = row.product
-        dataset_name = row.dataset
-        print(f"Reading {zarr_path}")
-        try:
-            dataset = xarray.open_zarr(fs.get_mapper(zarr_path), consolidated=True)
-        except Exception as e:
-            logger.error(f"Could not read {zarr_path}, failed with error: {e}")
-            continue
-        if product == "ts":
-            dataset["time"] = dataset.time.dt.year
-            print(dataset)
-
-        for variable in eval(row.variables):
-            plot_variable(dataset, dataset_name, product, row, variable)
-            if product != "trend":
-                plot_variable(dataset, dataset_name, product, row, variable + "_anom")
+def get_ticks(labels: pandas.Index, max_ticks: int = 30) -> tuple[list, list]:
+    """Get the positions and labels of at most max_ticks ticks of a table axis."""
+    step = max(len(labels) // max_ticks, 1)
+    positions = list(range(0, len(labels), step))
+    tick_labels = [
+        "-".join(map(str, labels[i])) if isinstance(labels[i], tuple) else labels[i]
+        for i in positions
+    ]
+    return positions, tick_labels
 
 
 def plot_variable(dataset, dataset_name, product, row, variable):
@@ -63,8 +93,12 @@ def plot_variable(dataset, dataset_name, product, row, variable):
     else:
         raise RuntimeError("Unknown product")
     units = dataset[variable].attrs["units"]
-    pyplot.figure(figsize=(15, 7.5))
-    ax = sns.heatmap(table, cbar_kws=dict(label=units))
+    fig, ax = pyplot.subplots(figsize=(15, 7.5))
+    image = ax.imshow(table.to_numpy(), aspect="auto", interpolation="nearest")
+    fig.colorbar(image, ax=ax, label=units)
+    ax.set_xticks(*get_ticks(table.columns))
+    ax.tick_params(axis="x", labelrotation=90)
+    ax.set_yticks(*get_ticks(table.index))
     pyplot.title(f"{variable=} {dataset_name=} {product=}")
     ax.fmt_xdata = DateFormatter("% Y")
     pyplot.tight_layout()
@@ -76,6 +110,7 @@ def plot_variable(dataset, dataset_name, product, row, variable):
         figure_path = Path("../figures", f"{variable}_{dataset_name}_{product}.png")
     print(f"Writing {figure_path}")
     pyplot.savefig(figure_path)
+    pyplot.close(fig)
 
 
 if __name__ == "__main__":
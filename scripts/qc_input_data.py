@@ -20,6 +20,18 @@ from scripts.get_climatologies import VARIABLES
 logger = get_logger(__name__)
 
 
+def floor_times(times: pd.Index, monthly: bool) -> pd.Index | list:
+    """Set the times to the start of their day, or of their month if monthly."""
+    if not isinstance(times, pd.DatetimeIndex):
+        # cftime dates have no vectorized equivalent
+        if monthly:
+            return [t.replace(day=1, hour=0, minute=0) for t in times]
+        return [t.replace(hour=0, minute=0) for t in times]
+    if monthly:
+        return times.to_period("M").to_timestamp()
+    return times.normalize()
+
+
 def check_variable_data(
     varname: str,
     location: InputLocation,
@@ -56,20 +68,18 @@ def check_variable_data(
             rawname,
             varname,
         )
-        times = dataset.time.to_index()
-        if isinstance(member, CmorEerieMember) and "mon" in member.cmor_table:
-            freq = "MS"
-            dataset["time"] = [t.replace(day=1, hour=0, minute=0) for t in times]
-        else:
-            dataset["time"] = [t.replace(hour=0, minute=0) for t in times]
-            freq = "D"
+        monthly = isinstance(member, CmorEerieMember) and "mon" in member.cmor_table
+        freq = "MS" if monthly else "D"
+        dataset["time"] = floor_times(dataset.time.to_index(), monthly)
         mask = ~dataset.time.to_index().duplicated()
         dataset = dataset.sel(time=mask)
         new_times = pd.date_range(
             start=dataset.time.to_index()[0], end=dataset.time.to_index()[-1], freq=freq
         )
         dataset = dataset[rawname].reindex(time=new_times).to_dataset(name=rawname)
-        print(dataset)
+        logger.debug(
+            f"Dataset sizes {dict(dataset.sizes)}, variables {list(dataset.data_vars)}"
+        )
         # Squeeze out singleton dimensions
         dataset = dataset.squeeze()
         dataset_cmor = to_cmor_names(dataset, rawname, varname)
@@ -77,8 +87,8 @@ def check_variable_data(
         dataset_cmor = fix_units(dataset_cmor, varname)
         nan_mask = dataset_cmor[varname].isnull().all(dim=("lat", "lon"))
         nan_times = dataset_cmor.time.to_index()[nan_mask]
-        print(nan_times)
-        nan_records[member.slug] = [t.strftime("%Y-%m-%d") for t in nan_times]
+        logger.info(f"{len(nan_times)} times with only missing values for {member}")
+        nan_records[member.slug] = nan_times.strftime("%Y-%m-%d").tolist()
 
     return nan_records
 
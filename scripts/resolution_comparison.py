@@ -1,7 +1,22 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import xarray
 from xarray_regrid import Grid
 
 
+def regrid_file(
+    ifile: str, grid: xarray.Dataset, time_slice: slice, output_path: str
+) -> str:
+    """Regrid the zos of a file to a grid and write it to a netCDF file."""
+    dataset = (
+        xarray.open_dataset(ifile)[["zos"]]
+        .sel(time=time_slice)
+        .regrid.conservative(grid)
+    )
+    dataset.to_netcdf(output_path)
+    return output_path
+
+
 def main():
     ifile_hires = (
         "/work/bm1344/DKRZ/MOHC/HadGEM3-GC5-EERIE-N640-ORCA12/eerie-ssp245/"
@@ -35,24 +50,19 @@ def main():
         resolution_lon=1.25,
     ).create_regridding_dataset(lat_name="lat", lon_name="lon")
     time_slice = slice("2050-01-01", "2050-02-01")
-    ds_hires = (
-        xarray.open_dataset(ifile_hires)[["zos"]]
-        .sel(time=time_slice)
-        .regrid.conservative(grid_hires)
-    )
-    ds_midres = (
-        xarray.open_dataset(ifile_midres)[["zos"]]
-        .sel(time=time_slice)
-        .regrid.conservative(grid_midres)
-    )
-    ds_lowres = (
-        xarray.open_dataset(ifile_lowres)[["zos"]]
-        .sel(time=time_slice)
-        .regrid.conservative(grid_lowres)
-    )
-    ds_hires.to_netcdf("~/hadgem_hires_ssp245_205001.nc")
-    ds_midres.to_netcdf("~/hadgem_midres_ssp245_205001.nc")
-    ds_lowres.to_netcdf("~/hadgem_lowres_ssp245_205001.nc")
+    # The three files are independent, so they are regridded at the same time in
+    # separate processes.
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(regrid_file, ifile, grid, time_slice, output_path)
+            for ifile, grid, output_path in [
+                (ifile_hires, grid_hires, "~/hadgem_hires_ssp245_205001.nc"),
+                (ifile_midres, grid_midres, "~/hadgem_midres_ssp245_205001.nc"),
+                (ifile_lowres, grid_lowres, "~/hadgem_lowres_ssp245_205001.nc"),
+            ]
+        ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 import importlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
-import pandas
+import numpy
 import xarray
 import zarr
 from dask.diagnostics import ProgressBar
@@ -41,28 +43,45 @@ member2shortmember = {
 }
 
 
+# Units of the products that differ from the ones of the CMOR tables
+UNITS_OVERRIDE = dict(
+    tas="degC", tasmin="degC", tasmax="degC", tos="degC", pr="mm day-1"
+)
+TREND_UNITS_OVERRIDE = dict(
+    tas="degC decade-1",
+    tasmin="degC decade-1",
+    tasmax="degC decade-1",
+    tos="degC decade-1",
+    pr="mm day-1",
+)
+
+
+# Auxiliary variables of the inputs that are not uploaded
+DROP_VARIABLES = [
+    "height2m",
+    "height10m",
+    "height_2",
+    "height_3",
+    "lev",
+    "latitude_longitude",
+    "lon_bnds",
+    "lat_bnds",
+]
+
+
 def get_merged_dataset(ifiles, chunks, drop_member: bool = False):
-    to_merge = [
-        xarray.open_dataset(f)
-        .drop_vars(
-            [
-                "height2m",
-                "height10m",
-                "height_2",
-                "height_3",
-                "lev",
-                "latitude_longitude",
-                "lon_bnds",
-                "lat_bnds",
-            ],
-            errors="ignore",
-        )
-        .chunk(chunks)
-        for f in ifiles
-    ]
-    if drop_member:
-        to_merge = [ds.drop_vars("member") for ds in to_merge]
-    dataset = xarray.merge(to_merge, join="outer")
+    # The files are opened in parallel, and the auxiliary variables are skipped
+    # when they are read instead of dropped afterwards.
+    drop_variables = DROP_VARIABLES + ["member"] if drop_member else DROP_VARIABLES
+    dataset = xarray.open_mfdataset(
+        ifiles,
+        combine="by_coords",
+        compat="no_conflicts",
+        join="outer",
+        parallel=True,
+        chunks=chunks,
+        drop_variables=drop_variables,
+    )
     return dataset
 
 
@@ -79,8 +98,11 @@ def shorten_members(dataset):
     logger.info(
         f"Mapping members {dataset.member.to_index().tolist()} to short names with {member2shortmember}"
     )
-    dataset["member"] = dataset["member"].to_index().map(member2shortmember)
-    assert not dataset.member.isnull().any()
+    members = dataset["member"].values.tolist()
+    missing = [m for m in members if m not in member2shortmember]
+    assert not missing, f"Members without a short name: {missing}"
+    short_members = numpy.array([member2shortmember[m] for m in members], dtype=object)
+    dataset = dataset.assign_coords(member=short_members)
     return dataset
 
 
@@ -162,7 +184,9 @@ def upload_eerie_time_series(variables: list[str], experiment: str, region_set:
         f"{idir}/{varname}_{experiment}_EERIE_{region_set}_ts.nc"
         for varname in variables
     ]
-    chunks = dict(member=-1, time_filter=1, time=-1, region=1)
+    # All the regions go in one chunk, the series are small and one object per
+    # region made the writes and reads bound by the number of S3 requests.
+    chunks = dict(member=-1, time_filter=1, time=-1, region=-1)
     dataset = get_merged_dataset(ifiles, chunks)
     dataset = dataset.drop_vars(["height2m", "height10m", "height_3"], errors="ignore")
     dataset = set_cmor_metadata(dataset, "ts")
@@ -170,7 +194,7 @@ def upload_eerie_time_series(variables: list[str], experiment: str, region_set:
     if experiment != "hist-amip":
         dataset = shorten_members(dataset)
     encoding = get_encoding(dataset, chunks)
-    logger.info(dataset.tas)
+    logger.debug(f"Dataset sizes {dict(dataset.sizes)}")
     logger.info(encoding)
     fs = get_filesystem()
     # Create an S3 store
@@ -178,10 +202,12 @@ def upload_eerie_time_series(variables: list[str], experiment: str, region_set:
     if fs.exists(zarr_url):
         logger.info(f"Clearing existing store {zarr_url}")
         fs.rm(zarr_url, recursive=True)
-    with ProgressBar():
-        dataset.to_zarr(
-            store=store, zarr_format=2, consolidated=True, encoding=encoding, mode="w"
-        )
+    # No progress bar, the time series of the region sets are uploaded at the same
+    # time and the dask callbacks of a bar would report the tasks of all of them.
+    logger.info(f"Saving {zarr_url}")
+    dataset.to_zarr(
+        store=store, zarr_format=2, consolidated=True, encoding=encoding, mode="w"
+    )
 
 
 def upload_obs_time_series(variables: list[str], region_set: str):
@@ -194,11 +220,11 @@ def upload_obs_time_series(variables: list[str], region_set: str):
         for varname in variables
     ]
     logger.info(f"Reading {ifiles}")
-    chunks = dict(time_filter=1, time=-1, region=1)
+    chunks = dict(time_filter=1, time=-1, region=-1)
     dataset = get_merged_dataset(ifiles, chunks, drop_member=True)
     # We need to add a member here, or the frontend breaks
     dataset = dataset.expand_dims(dim=dict(member=["obs"]))
-    chunks = dict(member=1, time_filter=1, time=-1, region=1)
+    chunks = dict(member=1, time_filter=1, time=-1, region=-1)
     dataset = dataset.drop_vars(["height2m", "height10m"], errors="ignore")
     dataset = set_cmor_metadata(dataset, "ts")
     dataset = dataset.chunk(chunks)
@@ -209,10 +235,10 @@ def upload_obs_time_series(variables: list[str], region_set: str):
     if fs.exists(zarr_url):
         logger.info(f"Clearing existing store {zarr_url}")
         fs.rm(zarr_url, recursive=True)
-    with ProgressBar():
-        dataset.to_zarr(
-            store=store, zarr_format=2, consolidated=True, encoding=encoding, mode="w"
-        )
+    logger.info(f"Saving {zarr_url}")
+    dataset.to_zarr(
+        store=store, zarr_format=2, consolidated=True, encoding=encoding, mode="w"
+    )
 
 
 def upload_eddy_rich_zarr():
@@ -270,21 +296,26 @@ def upload_eddy_rich_zarr_5lev():
         )
 
 
-def get_variable_cmor_metadata(varname: str):
-    realm = "Omon" if varname in OCEAN_VARIABLES else "Amon"
+@lru_cache(maxsize=4)
+def _load_cmor_table(realm: str) -> dict:
+    """Read the variable entries of a CMOR table, once per realm."""
     cmor_json = Path(
         str(importlib.resources.files("eerieview")),
         f"resources/EERIE_{realm}.json",
     )
     with open(cmor_json, "r") as fileobj:
-        table = json.load(fileobj)["variable_entry"]
-    df = pandas.DataFrame.from_dict(table, orient="index")
-    return df.loc[varname]
+        return json.load(fileobj)["variable_entry"]
+
+
+def get_variable_cmor_metadata(varname: str) -> dict:
+    realm = "Omon" if varname in OCEAN_VARIABLES else "Amon"
+    return _load_cmor_table(realm)[varname]
 
 
 def set_cmor_metadata(dataset: xarray.Dataset, product) -> xarray.Dataset:
     for varname in dataset.data_vars:
-        varname_noanom = str(varname).replace("_anom", "").replace("_pvalue", "")
+        name = str(varname)
+        varname_noanom = name.replace("_anom", "").replace("_pvalue", "")
         if varname_noanom == "eke":
             attrs = dict(
                 standard_name="eddy_kinetic_energy",
@@ -293,25 +324,20 @@ def set_cmor_metadata(dataset: xarray.Dataset, product) -> xarray.Dataset:
             )
         else:
             attrs = get_variable_cmor_metadata(varname_noanom)
-        for attrname in ["long_name", "standard_name", "units"]:
-            attrval = attrs[attrname]
-            if attrname == "units":
-                if varname_noanom in ["tas", "tasmin", "tasmax", "tos"]:
-                    if product == "trend":
-                        attrval = "degC decade-1"
-                    else:
-                        attrval = "degC"
-                if varname_noanom == "pr":
-                    attrval = "mm day-1"
-            if "anom" in str(varname):
-                if attrname == "standard_name":
-                    attrval += "_anomaly"
-                if attrname == "long_name":
-                    attrval += " Anomaly"
-            dataset[varname].attrs[attrname] = attrval
+        standard_name = attrs["standard_name"]
+        long_name = attrs["long_name"]
+        units_override = TREND_UNITS_OVERRIDE if product == "trend" else UNITS_OVERRIDE
+        units = units_override.get(varname_noanom, attrs["units"])
+        if "anom" in name:
+            standard_name += "_anomaly"
+            long_name += " Anomaly"
         if product == "trend":
-            dataset[varname].attrs["standard_name"] += "_trend"
-            dataset[varname].attrs["long_name"] += " Trend"
+            standard_name += "_trend"
+            long_name += " Trend"
+        # The attrs of the variable are updated in place, at once
+        dataset[varname].attrs.update(
+            long_name=long_name, standard_name=standard_name, units=units
+        )
     return dataset
 
 
@@ -351,8 +377,15 @@ def main():
             upload_eerie_climatologies(
                 variables_exp, product=product, experiment=experiment, grid="025"
             )
-    upload_time_series(variables, variables_amip, "IPCC")
-    upload_time_series(variables, variables_amip, "EDDY")
+    # The region sets write to different stores and the uploads wait mostly on
+    # S3, so they run at the same time.
+    region_sets = ["IPCC", "EDDY"]
+    with ThreadPoolExecutor(max_workers=len(region_sets)) as executor:
+        list(
+            executor.map(
+                partial(upload_time_series, variables, variables_amip), region_sets
+            )
+        )
 
 
 if __name__ == "__main__":
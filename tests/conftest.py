@@ -1,11 +1,13 @@
 from datetime import datetime
+from functools import lru_cache
 
 import numpy
 import pandas
 import xarray
 
 
-def mock_dataset(
+@lru_cache(maxsize=None)
+def _build_mock_dataset(
     varname: str,
     freq: str = "D",
     res: float = 1.0,
@@ -50,13 +52,14 @@ def mock_dataset(
     lons = numpy.arange(-180 + res, 180, res)
     generator = numpy.random.default_rng(42)
     data = generator.standard_normal((len(times), len(lats), len(lons)), "float32")
+    # Modify the data in place, without full size temporary arrays
     if scale is not None:
-        data = data * scale
+        data *= scale
     if offset is not None:
-        data = data + offset
+        data += offset
     if trend is not None:
         trend_data = trend * (times.year - times.year[0])
-        data = data + trend_data.values.reshape([-1, 1, 1])
+        data += trend_data.values.astype("float32")[:, None, None]
     da = xarray.DataArray(data, coords=[times, lats, lons], dims=["time", "lat", "lon"])
     # Add some points with nans in all steps
     da[:, 0:2, 0:2] = numpy.nan
@@ -68,6 +71,27 @@ def mock_dataset(
     return dataset
 
 
+def mock_dataset(
+    varname: str,
+    freq: str = "D",
+    res: float = 1.0,
+    time_start: datetime = datetime(2000, 1, 1),
+    time_end: datetime = datetime(2001, 12, 31),
+    scale: float | None = None,
+    offset: float | None = None,
+    trend: float | None = None,
+) -> xarray.Dataset:
+    """Return a mock dataset, which is only built once for each set of arguments.
+
+    A deep copy is returned so the tests do not modify the cached one, not even its
+    data in place.
+    """
+    dataset = _build_mock_dataset(
+        varname, freq, res, time_start, time_end, scale, offset, trend
+    )
+    return dataset.copy(deep=True)
+
+
 def mocked_get_entry_dataset(catalogue, member, rawname, location="cloud", trend=None):
     dataset = mock_dataset(
         rawname,
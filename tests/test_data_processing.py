@@ -0,0 +1,28 @@
+from datetime import datetime
+
+import xarray
+
+from eerieview.data_models import TimeFilter
+from eerieview.data_processing import (
+    filter_time_axes,
+    filter_time_axis,
+    get_time_filters,
+    seltime,
+)
+from tests.conftest import mock_dataset
+
+
+def test_filter_time_axes():
+    dataset = mock_dataset("tas", freq="MS", res=10.0, time_end=datetime(2002, 12, 31))
+    time_filters = get_time_filters() + (TimeFilter(1, "month"), TimeFilter(7, "month"))
+    filtered = filter_time_axes(dataset, time_filters)
+    assert len(filtered) == len(time_filters)
+    for time_filter, dataset_filtered in zip(time_filters, filtered):
+        if time_filter.units == "year":
+            expected = dataset
+        else:
+            expected = seltime(dataset, "time", **{time_filter.units: time_filter.freq})
+        xarray.testing.assert_identical(dataset_filtered, expected)
+        xarray.testing.assert_identical(
+            filter_time_axis(dataset, time_filter), expected
+        )
@@ -0,0 +1,58 @@
+import numpy
+import pandas
+import xarray
+
+from eerieview.eke import write_clim_and_anom
+
+
+def _reference_clim(data: numpy.ndarray, times: pandas.DatetimeIndex) -> numpy.ndarray:
+    """Compute the rolling climatology directly with sliding windows, as a reference.
+
+    A 21-year centered mean per day of year with at least 11 valid values, then a
+    5-day centered mean with at least 3 valid values. The day 366 has no climatology
+    before the 5-day smoothing.
+    """
+    doy_clim = numpy.full(data.shape, numpy.nan)
+    for doy in range(1, 366):
+        idx = numpy.flatnonzero(times.dayofyear == doy)
+        for iyear, itime in enumerate(idx):
+            window = data[idx[max(iyear - 10, 0) : iyear + 11]]
+            valid = numpy.isfinite(window).sum(axis=0)
+            with numpy.errstate(invalid="ignore"):
+                mean = numpy.nansum(window, axis=0) / valid
+            doy_clim[itime] = numpy.where(valid >= 11, mean, numpy.nan)
+    clim = numpy.full(data.shape, numpy.nan)
+    for itime in range(len(times)):
+        window = doy_clim[max(itime - 2, 0) : itime + 3]
+        valid = numpy.isfinite(window).sum(axis=0)
+        with numpy.errstate(invalid="ignore"):
+            mean = numpy.nansum(window, axis=0) / valid
+        clim[itime] = numpy.where(valid >= 3, mean, numpy.nan)
+    return clim
+
+
+def test_write_clim_and_anom(tmp_path):
+    times = pandas.date_range("2000-01-01", "2011-12-31", freq="D")
+    generator = numpy.random.default_rng(42)
+    data = generator.standard_normal((len(times), 7, 6), "float32")
+    # Some windows have too few valid values, and one point is always missing
+    data[generator.random(data.shape) < 0.05] = numpy.nan
+    data[:, 0, 0] = numpy.nan
+    zos = xarray.DataArray(
+        data,
+        coords=dict(time=times, lat=numpy.arange(7.0), lon=numpy.arange(6.0)),
+        dims=("time", "lat", "lon"),
+        name="zos",
+    ).chunk(dict(time=100))
+    clim_file = tmp_path / "clim.zarr"
+    anom_file = tmp_path / "anom.zarr"
+    # Several batches of tiles, the last ones smaller than the chunk size
+    write_clim_and_anom(zos, clim_file, anom_file, chunk_size=3, num_workers=4)
+    expected_clim = _reference_clim(data.astype(float), times).astype("float32")
+    expected_anom = data - expected_clim
+    numpy.testing.assert_allclose(
+        xarray.open_zarr(clim_file).zos.values, expected_clim, rtol=1e-5, atol=1e-6
+    )
+    numpy.testing.assert_allclose(
+        xarray.open_zarr(anom_file).zos.values, expected_anom, rtol=1e-5, atol=1e-6
+    )